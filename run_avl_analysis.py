@@ -6,6 +6,12 @@ import subprocess
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# .ft output keys mapped to result fields, matched with one precompiled pattern
+_FT_KEYS = {'CLtot': 'CL', 'CDtot': 'CD', 'Cmtot': 'CM', 'e': 'e'}
+_FT_RE = re.compile(r'\b(' + '|'.join(map(re.escape, _FT_KEYS)) + r')\s*=\s*'
+                    r'([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)')
 
 def run_avl_at_alpha(avl_exe, avl_file, mass_file, alpha, output_prefix):
     """
@@ -73,24 +79,18 @@ def parse_ft_file(ft_file, alpha):
 
     try:
         with open(ft_file, 'r') as f:
-            content = f.read()
-
-            # Parse coefficients
-            match = re.search(r'CLtot\s*=\s*([-+]?\d*\.\d+)', content)
-            if match:
-                results['CL'] = float(match.group(1))
-
-            match = re.search(r'CDtot\s*=\s*([-+]?\d*\.\d+)', content)
-            if match:
-                results['CD'] = float(match.group(1))
+            found = set()
 
-            match = re.search(r'Cmtot\s*=\s*([-+]?\d*\.\d+)', content)
-            if match:
-                results['CM'] = float(match.group(1))
+            # Stream lines and stop once every coefficient has been found
+            for line in f:
+                for match in _FT_RE.finditer(line):
+                    key = _FT_KEYS[match.group(1)]
+                    if key not in found:
+                        results[key] = float(match.group(2))
+                        found.add(key)
 
-            match = re.search(r'e\s*=\s*([-+]?\d*\.\d+)', content)
-            if match:
-                results['e'] = float(match.group(1))
+                if len(found) == len(_FT_KEYS):
+                    break
 
     except Exception as e:
         print(f"  Error parsing {ft_file}: {e}")
@@ -120,16 +120,22 @@ def main():
 
     results = []
 
-    for alpha in alphas:
-        print(f"Running alpha = {alpha:6.1f}°...", end='', flush=True)
-
+    # AVL runs are independent processes; threads suffice since
+    # subprocess.run releases the GIL while waiting
+    def run_case(alpha):
         output_prefix = os.path.join(base_dir, f"alpha_{alpha:+04.0f}")
-        result = run_avl_at_alpha(avl_exe, avl_file, mass_file, alpha, output_prefix)
+        return run_avl_at_alpha(avl_exe, avl_file, mass_file, alpha, output_prefix)
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        case_results = list(ex.map(run_case, alphas))
+
+    for alpha, result in zip(alphas, case_results):
+        print(f"Alpha = {alpha:6.1f}°...", end='')
 
         if result:
             results.append(result)
-            ld_ratio = result['CL'] / result['CD'] if result['CD'] > 0.0001 else 0
-            print(f" CL={result['CL']:7.4f}, CD={result['CD']:7.5f}, L/D={ld_ratio:6.1f}")
+            result['LD'] = result['CL'] / result['CD'] if result['CD'] > 0.0001 else 0.0
+            print(f" CL={result['CL']:7.4f}, CD={result['CD']:7.5f}, L/D={result['LD']:6.1f}")
         else:
             print(" FAILED")
 
@@ -141,17 +147,15 @@ def main():
     print("-" * 70)
 
     for r in results:
-        ld = r['CL'] / r['CD'] if r['CD'] > 0.0001 else 0
-        print(f"{r['alpha']:8.1f}  {r['CL']:8.4f}  {r['CD']:8.5f}  {r['CM']:8.4f}  {ld:8.1f}")
+        print(f"{r['alpha']:8.1f}  {r['CL']:8.4f}  {r['CD']:8.5f}  {r['CM']:8.4f}  {r['LD']:8.1f}")
 
     print("=" * 70)
 
     # Find max L/D
     if results:
-        best = max(results, key=lambda r: r['CL'] / r['CD'] if r['CD'] > 0.0001 else 0)
-        best_ld = best['CL'] / best['CD'] if best['CD'] > 0.0001 else 0
+        best = max(results, key=lambda r: r['LD'])
 
-        print(f"\nBest L/D = {best_ld:.1f} at alpha = {best['alpha']:.1f}°")
+        print(f"\nBest L/D = {best['LD']:.1f} at alpha = {best['alpha']:.1f}°")
         print(f"  CL = {best['CL']:.4f}")
         print(f"  CD = {best['CD']:.5f}")
 
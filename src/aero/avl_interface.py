@@ -5,9 +5,53 @@ AVL interface for running analyses and parsing results.
 import subprocess
 import os
 import re
+import functools
+import time
 import numpy as np
 from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+
+# Precompiled patterns for AVL output files. Numbers always have an integer
+# part and may be written in scientific notation (e.g. 0.12345E-02); keys
+# are anchored on a word boundary since several share a line.
+_NUM = r'([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)'
+
+# .ft output keys mapped to AVLResults fields, matched in a single pass
+_FT_KEYS = {
+    'CLtot': 'CL',
+    'CDtot': 'CD',
+    'Cmtot': 'CM',
+    'CYtot': 'CY',
+    'Cltot': 'Cl',
+    'Cntot': 'Cn',
+    'e': 'e_span_eff'
+}
+_FT_RE = re.compile(r'\b(' + '|'.join(map(re.escape, _FT_KEYS)) + r')\s*=\s*' + _NUM)
+
+# .st output keys mapped to the literal token AVL writes for them
+_ST_TOKENS = {
+    'CLa': 'CLa',
+    'CMa': 'Cma',
+    'CYb': 'CYb',
+    'Clb': 'Clb',
+    'Cnb': 'Cnb',
+    'Xnp': 'Xnp'
+}
+_ST_PATTERNS = {
+    key: re.compile(r'\b' + re.escape(token) + r'\s*=\s*' + _NUM)
+    for key, token in _ST_TOKENS.items()
+}
+
+# Sweep results as one contiguous array per coefficient; missing values are NaN
+_SWEEP_DTYPE = np.dtype([
+    ('alpha', 'f8'), ('beta', 'f8'),
+    ('CL', 'f8'), ('CD', 'f8'), ('CM', 'f8'),
+    ('CY', 'f8'), ('Cl', 'f8'), ('Cn', 'f8'),
+    ('e_span_eff', 'f8'),
+    ('CLa', 'f8'), ('CMa', 'f8'), ('CYb', 'f8'), ('Clb', 'f8'), ('Cnb', 'f8'),
+    ('neutral_point', 'f8')
+])
 
 
 @dataclass
@@ -40,6 +84,53 @@ class AVLResults:
     neutral_point: float = None
 
 
+def _file_mtime(path: str) -> float:
+    """Modification time of path, or None if it is not given or missing."""
+    if path and os.path.exists(path):
+        return os.path.getmtime(path)
+    return None
+
+
+def _load_commands(avl_file: str, mass_file: str = None) -> List[str]:
+    """AVL commands to load geometry and mass and enter the OPER menu."""
+    commands = ["LOAD", avl_file]
+
+    if mass_file and os.path.exists(mass_file):
+        commands += ["MASS", mass_file]
+
+    commands.append("OPER")
+    return commands
+
+
+def _operating_point_commands(alpha: float, beta: float, mach: float) -> List[str]:
+    """
+    OPER menu commands to set alpha, beta and Mach.
+
+    All three are always sent, so values from an earlier case in the same
+    AVL process never carry over.
+    """
+    return ["A", f"A {alpha}", "",
+            "B", f"B {beta}", "",
+            "M", f"M {mach}", ""]
+
+
+@functools.lru_cache(maxsize=1024)
+def _run_case_cached(avl_exe_path: str, avl_file: str, mass_file: str,
+                     avl_mtime: float, mass_mtime: float,
+                     alpha: float, beta: float, mach: float,
+                     output_prefix: str) -> AVLResults:
+    """
+    Run a single AVL case; memoized by AVLInterface.run_avl_case.
+
+    Keyed on the executable path rather than an AVLInterface instance so
+    the cache does not keep interfaces alive. The file modification times
+    are only part of the key, invalidating entries when inputs change.
+    """
+    return AVLInterface(avl_exe_path)._run_case(
+        avl_file, mass_file, alpha, beta, mach, output_prefix
+    )
+
+
 class AVLInterface:
     """
     Interface to AVL executable.
@@ -63,7 +154,8 @@ class AVLInterface:
 
     def run_avl_case(self, avl_file: str, mass_file: str = None,
                     alpha: float = 0.0, beta: float = 0.0,
-                    mach: float = 0.0, output_prefix: str = "avl_output") -> AVLResults:
+                    mach: float = 0.0, output_prefix: str = "avl_output",
+                    verbose: bool = False) -> AVLResults:
         """
         Run a single AVL analysis case.
 
@@ -81,37 +173,43 @@ class AVLInterface:
             Mach number
         output_prefix : str
             Prefix for output files
+        verbose : bool
+            Capture and print AVL console output (default discards it)
 
         Returns:
         --------
         results : AVLResults
             Analysis results
-        """
 
-        # Build command sequence
-        commands = []
-        commands.append("LOAD")  # Load geometry
-        commands.append(avl_file)
+        Notes:
+        ------
+        Results are cached on the input file modification times and the
+        operating point, so repeating a case with unchanged geometry and
+        mass files does not rerun AVL. Verbose calls always run AVL so its
+        console output is printed.
+        """
 
-        if mass_file and os.path.exists(mass_file):
-            commands.append("MASS")  # Load mass file
-            commands.append(mass_file)
+        if verbose:
+            return self._run_case(avl_file, mass_file, alpha, beta, mach,
+                                  output_prefix, verbose=True)
 
-        commands.append("OPER")  # Enter OPER menu
+        result = _run_case_cached(
+            self.avl_exe_path, avl_file, mass_file,
+            _file_mtime(avl_file), _file_mtime(mass_file),
+            alpha, beta, mach, output_prefix
+        )
 
-        # Set operating point
-        commands.append("A")  # Set alpha
-        commands.append(f"A {alpha}")
-        commands.append("")
+        # Return a copy so callers cannot modify the cached entry
+        return replace(result)
 
-        commands.append("B")  # Set beta
-        commands.append(f"B {beta}")
-        commands.append("")
+    def _run_case(self, avl_file: str, mass_file: str,
+                  alpha: float, beta: float, mach: float,
+                  output_prefix: str, verbose: bool = False) -> AVLResults:
+        """Run a single AVL case without caching."""
 
-        if mach > 0:
-            commands.append("M")  # Set Mach
-            commands.append(f"M {mach}")
-            commands.append("")
+        # Build command sequence
+        commands = _load_commands(avl_file, mass_file)
+        commands += _operating_point_commands(alpha, beta, mach)
 
         commands.append("X")  # Execute analysis
 
@@ -125,46 +223,70 @@ class AVLInterface:
         commands.append("")  # Return to OPER menu
         commands.append("QUIT")  # Quit AVL
 
-        # Write command file
-        cmd_file = f"{output_prefix}_commands.txt"
-        with open(cmd_file, 'w') as f:
-            f.write("\n".join(commands))
+        cmd_input = "\n".join(commands) + "\n"
 
-        # Run AVL
+        # Run AVL, piping commands directly to stdin
         try:
-            with open(cmd_file, 'r') as f:
-                result = subprocess.run(
-                    [self.avl_exe_path],
-                    stdin=f,
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+            self._execute(cmd_input, timeout=30, verbose=verbose)
 
             # Parse results from output files
-            results = self._parse_ft_file(f"{output_prefix}.ft", alpha, beta)
-
-            # Try to parse stability derivatives
-            if os.path.exists(f"{output_prefix}.st"):
-                stab_derivs = self._parse_st_file(f"{output_prefix}.st")
-                results.CLa = stab_derivs.get('CLa')
-                results.CMa = stab_derivs.get('CMa')
-                results.CYb = stab_derivs.get('CYb')
-                results.Clb = stab_derivs.get('Clb')
-                results.Cnb = stab_derivs.get('Cnb')
-                results.neutral_point = stab_derivs.get('Xnp')
-
-            # Clean up temporary files
-            if os.path.exists(cmd_file):
-                os.remove(cmd_file)
-
-            return results
+            return self._parse_case_files(output_prefix, alpha, beta)
 
         except subprocess.TimeoutExpired:
             raise RuntimeError("AVL execution timed out")
         except Exception as e:
             raise RuntimeError(f"AVL execution failed: {str(e)}")
 
+    def _execute(self, cmd_input: str, timeout: float, verbose: bool = False):
+        """
+        Run AVL with the given command script on stdin.
+
+        Results are read back from the output files, so console output is
+        discarded unless verbose is set, avoiding buffering it in memory.
+        """
+        if verbose:
+            result = subprocess.run(
+                [self.avl_exe_path],
+                input=cmd_input,
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+            print(result.stdout)
+            if result.stderr:
+                print(result.stderr)
+            return
+
+        p = subprocess.Popen(
+            [self.avl_exe_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        try:
+            p.communicate(cmd_input, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            p.kill()
+            p.communicate()
+            raise
+
+    def _parse_case_files(self, output_prefix: str, alpha: float, beta: float) -> AVLResults:
+        """Parse the .ft file and, if present, the .st file for one case."""
+        results = self._parse_ft_file(f"{output_prefix}.ft", alpha, beta)
+
+        # Try to parse stability derivatives
+        if os.path.exists(f"{output_prefix}.st"):
+            stab_derivs = self._parse_st_file(f"{output_prefix}.st")
+            results.CLa = stab_derivs.get('CLa')
+            results.CMa = stab_derivs.get('CMa')
+            results.CYb = stab_derivs.get('CYb')
+            results.Clb = stab_derivs.get('Clb')
+            results.Cnb = stab_derivs.get('Cnb')
+            results.neutral_point = stab_derivs.get('Xnp')
+
+        return results
+
     def _parse_ft_file(self, ft_file: str, alpha: float, beta: float) -> AVLResults:
         """
         Parse AVL .ft (forces) output file.
@@ -185,46 +307,24 @@ class AVLInterface:
         if not os.path.exists(ft_file):
             raise FileNotFoundError(f"AVL output file not found: {ft_file}")
 
-        CL = CD = CM = CY = Cl = Cn = 0.0
-        e_span_eff = None
+        out = {'CL': 0.0, 'CD': 0.0, 'CM': 0.0, 'CY': 0.0, 'Cl': 0.0, 'Cn': 0.0,
+               'e_span_eff': None}
+        found = set()
 
         with open(ft_file, 'r') as f:
-            content = f.read()
-
-            # Parse force coefficients
-            match = re.search(r'CLtot\s*=\s*([-+]?\d*\.\d+)', content)
-            if match:
-                CL = float(match.group(1))
-
-            match = re.search(r'CDtot\s*=\s*([-+]?\d*\.\d+)', content)
-            if match:
-                CD = float(match.group(1))
-
-            match = re.search(r'Cmtot\s*=\s*([-+]?\d*\.\d+)', content)
-            if match:
-                CM = float(match.group(1))
-
-            match = re.search(r'CYtot\s*=\s*([-+]?\d*\.\d+)', content)
-            if match:
-                CY = float(match.group(1))
+            # Stream lines and stop once every coefficient has been found
+            # (first occurrence of each key wins)
+            for line in f:
+                for match in _FT_RE.finditer(line):
+                    field = _FT_KEYS[match.group(1)]
+                    if field not in found:
+                        out[field] = float(match.group(2))
+                        found.add(field)
 
-            match = re.search(r'Cltot\s*=\s*([-+]?\d*\.\d+)', content)
-            if match:
-                Cl = float(match.group(1))
+                if len(found) == len(_FT_KEYS):
+                    break
 
-            match = re.search(r'Cntot\s*=\s*([-+]?\d*\.\d+)', content)
-            if match:
-                Cn = float(match.group(1))
-
-            match = re.search(r'e\s*=\s*([-+]?\d*\.\d+)', content)
-            if match:
-                e_span_eff = float(match.group(1))
-
-        return AVLResults(
-            CL=CL, CD=CD, CM=CM, CY=CY, Cl=Cl, Cn=Cn,
-            alpha=alpha, beta=beta,
-            e_span_eff=e_span_eff
-        )
+        return AVLResults(**out, alpha=alpha, beta=beta)
 
     def _parse_st_file(self, st_file: str) -> Dict[str, float]:
         """
@@ -249,29 +349,25 @@ class AVLInterface:
         with open(st_file, 'r') as f:
             content = f.read()
 
-            # Common derivatives
-            patterns = {
-                'CLa': r'CLa\s*=\s*([-+]?\d*\.\d+)',
-                'CMa': r'Cma\s*=\s*([-+]?\d*\.\d+)',
-                'CYb': r'CYb\s*=\s*([-+]?\d*\.\d+)',
-                'Clb': r'Clb\s*=\s*([-+]?\d*\.\d+)',
-                'Cnb': r'Cnb\s*=\s*([-+]?\d*\.\d+)',
-                'Xnp': r'Xnp\s*=\s*([-+]?\d*\.\d+)'
-            }
-
-            for key, pattern in patterns.items():
-                match = re.search(pattern, content, re.IGNORECASE)
-                if match:
-                    derivs[key] = float(match.group(1))
+            # Only run the regex when its token is present (e.g. AVL may not
+            # write derivatives for an unconverged case)
+            for key, token in _ST_TOKENS.items():
+                if token in content:
+                    match = _ST_PATTERNS[key].search(content)
+                    if match:
+                        derivs[key] = float(match.group(1))
 
         return derivs
 
     def run_alpha_sweep(self, avl_file: str, mass_file: str = None,
                        alpha_range: Tuple[float, float, float] = (-5, 15, 1),
-                       beta: float = 0.0, mach: float = 0.0) -> List[AVLResults]:
+                       beta: float = 0.0, mach: float = 0.0) -> np.recarray:
         """
         Run sweep over angle of attack.
 
+        All cases run in one persistent AVL session (see AVLSession), so
+        geometry and mass are loaded once for the whole sweep.
+
         Parameters:
         -----------
         avl_file : str
@@ -287,31 +383,259 @@ class AVLInterface:
 
         Returns:
         --------
-        results : list of AVLResults
-            Results for each alpha
+        results : np.recarray
+            One record per alpha, with fields alpha, beta, CL, CD, CM, CY,
+            Cl, Cn, e_span_eff, CLa, CMa, CYb, Clb, Cnb and neutral_point
+            (NaN where AVL did not report a value). Each field is a
+            contiguous array, e.g. results.CL.
         """
 
         alphas = np.arange(*alpha_range)
-        results = []
+        results = np.zeros(len(alphas), dtype=_SWEEP_DTYPE)
 
         print(f"Running alpha sweep: {alpha_range[0]}° to {alpha_range[1]}° (step {alpha_range[2]}°)")
 
-        for i, alpha in enumerate(alphas):
-            print(f"  Alpha = {alpha:6.2f}° ({i+1}/{len(alphas)})", end='\r')
+        with AVLSession(self.avl_exe_path, avl_file, mass_file) as session:
+            for i, alpha in enumerate(alphas):
+                print(f"  Alpha = {alpha:6.2f}° ({i+1}/{len(alphas)})", end='\r')
 
-            result = self.run_avl_case(
-                avl_file=avl_file,
-                mass_file=mass_file,
-                alpha=alpha,
-                beta=beta,
-                mach=mach,
-                output_prefix=f"avl_alpha_{alpha:.1f}"
-            )
+                result = session.run_case(
+                    alpha=alpha,
+                    beta=beta,
+                    mach=mach,
+                    output_prefix=f"avl_alpha_{alpha:.1f}"
+                )
 
-            results.append(result)
+                record = [getattr(result, name) for name in _SWEEP_DTYPE.names]
+                results[i] = tuple(np.nan if v is None else v for v in record)
 
         print()  # New line after progress
-        return results
+        return results.view(np.recarray)
+
+    def run_alpha_sweep_batched(self, avl_file: str, mass_file: str = None,
+                                alphas: List[float] = None,
+                                beta: float = 0.0, mach: float = 0.0,
+                                output_prefix: str = "sweep",
+                                verbose: bool = False) -> List[AVLResults]:
+        """
+        Run an alpha sweep in a single AVL session.
+
+        Geometry and mass are loaded once and every alpha is executed from
+        the same OPER menu, avoiding a process launch per case.
+
+        Parameters:
+        -----------
+        avl_file : str
+            Path to .avl geometry file
+        mass_file : str
+            Path to .mass file (optional)
+        alphas : list of float
+            Angles of attack to run (degrees)
+        beta : float
+            Sideslip angle (degrees)
+        mach : float
+            Mach number
+        output_prefix : str
+            Prefix for output files (one .ft file per alpha)
+        verbose : bool
+            Capture and print AVL console output (default discards it)
+
+        Returns:
+        --------
+        results : list of AVLResults
+            Results for each alpha, in sweep order
+        """
+
+        if alphas is None:
+            alphas = np.arange(-5, 15, 1)
+
+        ft_files = [f"{output_prefix}_{i}.ft" for i in range(len(alphas))]
+
+        # Remove stale output so AVL does not prompt to overwrite
+        for ft_file in ft_files:
+            if os.path.exists(ft_file):
+                os.remove(ft_file)
+
+        # Build command sequence: load once, then run each alpha
+        commands = _load_commands(avl_file, mass_file)
+
+        for alpha, ft_file in zip(alphas, ft_files):
+            commands += _operating_point_commands(alpha, beta, mach)
+            commands += ["X", "FT", ft_file]
+
+        commands += ["", "QUIT"]
+
+        cmd_input = "\n".join(commands) + "\n"
+
+        try:
+            self._execute(cmd_input, timeout=30 + 10 * len(alphas), verbose=verbose)
+
+            return [self._parse_ft_file(ft_file, alpha, beta)
+                    for alpha, ft_file in zip(alphas, ft_files)]
+
+        except subprocess.TimeoutExpired:
+            raise RuntimeError("AVL execution timed out")
+        except Exception as e:
+            raise RuntimeError(f"AVL execution failed: {str(e)}")
+
+
+class AVLSession:
+    """
+    Persistent AVL process for running many cases.
+
+    AVL is started once, loads the geometry and mass files, and stays in
+    the OPER menu. Each case is streamed to its stdin, followed by a final
+    FT command to a sentinel file; since AVL handles commands in order, the
+    sentinel appearing means the case's output files are complete.
+
+    Usage:
+    ------
+    with AVLSession(avl_exe, "uav.avl", "uav.mass") as session:
+        result = session.run_case(alpha=2.0, output_prefix="case")
+    """
+
+    def __init__(self, avl_exe_path: str, avl_file: str, mass_file: str = None,
+                 timeout: float = 30.0, poll_interval: float = 0.01):
+        """
+        Initialize AVL session.
+
+        Parameters:
+        -----------
+        avl_exe_path : str
+            Path to AVL executable
+        avl_file : str
+            Path to .avl geometry file
+        mass_file : str
+            Path to .mass file (optional)
+        timeout : float
+            Maximum time to wait for a single case (seconds)
+        poll_interval : float
+            Interval between output file checks (seconds)
+        """
+        self._avl = AVLInterface(avl_exe_path)
+        self.avl_file = avl_file
+        self.mass_file = mass_file
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._process = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        """Start AVL and load geometry and mass."""
+        self._process = subprocess.Popen(
+            [self._avl.avl_exe_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        )
+
+        try:
+            self._send(_load_commands(self.avl_file, self.mass_file))
+        except RuntimeError:
+            self.close()
+            raise
+
+    def close(self):
+        """Quit AVL and wait for the process to exit."""
+        if self._process is None:
+            return
+
+        process, self._process = self._process, None
+
+        try:
+            process.stdin.write("\nQUIT\n")
+            process.stdin.flush()
+        except OSError:
+            pass  # AVL has already exited
+        finally:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+
+            try:
+                process.wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    def run_case(self, alpha: float = 0.0, beta: float = 0.0, mach: float = 0.0,
+                 output_prefix: str = "avl_session") -> AVLResults:
+        """
+        Run a single case in the open session.
+
+        Parameters:
+        -----------
+        alpha : float
+            Angle of attack (degrees)
+        beta : float
+            Sideslip angle (degrees)
+        mach : float
+            Mach number
+        output_prefix : str
+            Prefix for output files
+
+        Returns:
+        --------
+        results : AVLResults
+            Analysis results
+        """
+        if self._process is None:
+            raise RuntimeError("AVL session is not open")
+
+        ft_file = f"{output_prefix}.ft"
+        st_file = f"{output_prefix}.st"
+        done_file = f"{output_prefix}.done"
+
+        # Remove stale output so AVL does not prompt to overwrite and the
+        # sentinel can be detected
+        for out_file in (ft_file, st_file, done_file):
+            if os.path.exists(out_file):
+                os.remove(out_file)
+
+        commands = _operating_point_commands(alpha, beta, mach)
+        commands += ["X", "FT", ft_file, "ST", st_file, "FT", done_file]
+
+        self._send(commands)
+
+        try:
+            # AVL only opens the sentinel once the .st file has been closed
+            self._wait_for_file(done_file)
+
+            return self._avl._parse_case_files(output_prefix, alpha, beta)
+        finally:
+            if os.path.exists(done_file):
+                os.remove(done_file)
+
+    def _send(self, commands: List[str]):
+        """Write commands to AVL's stdin."""
+        try:
+            self._process.stdin.write("\n".join(commands) + "\n")
+            self._process.stdin.flush()
+        except OSError as e:
+            raise RuntimeError(f"AVL session terminated: {str(e)}")
+
+    def _wait_for_file(self, path: str):
+        """Poll until path exists or the AVL process exits."""
+        deadline = time.monotonic() + self.timeout
+
+        while time.monotonic() < deadline:
+            if os.path.exists(path):
+                return
+            if self._process.poll() is not None:
+                raise RuntimeError("AVL session terminated unexpectedly")
+
+            time.sleep(self.poll_interval)
+
+        raise RuntimeError(f"AVL execution timed out waiting for {path}")
 
 
 if __name__ == "__main__":
@@ -348,10 +672,10 @@ if __name__ == "__main__":
     results = avl.run_alpha_sweep(avl_file, mass_file, alpha_range=(-5, 15, 1), mach=0.25)
 
     # Plot results
-    alphas = [r.alpha for r in results]
-    CLs = [r.CL for r in results]
-    CDs = [r.CD for r in results]
-    CMs = [r.CM for r in results]
+    alphas = results.alpha
+    CLs = results.CL
+    CDs = results.CD
+    CMs = results.CM
 
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))
 
@@ -0,0 +1,16 @@
+"""
+Optional Numba JIT support.
+
+Numba is not a required dependency. When it is not installed, `njit`
+becomes a no-op decorator and the decorated functions run as plain
+NumPy code.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -12,6 +12,12 @@ import pandas as pd
 from typing import Tuple, Dict
 from dataclasses import dataclass
 
+# Handle imports for both package and standalone usage
+try:
+    from ._jit import njit
+except ImportError:
+    from _jit import njit
+
 
 @dataclass
 class WingGeometry:
@@ -32,59 +38,40 @@ class WingGeometry:
     dihedral: float        # Dihedral angle in degrees
 
 
-def read_csv_points(filepath: str, units: str = 'inches') -> np.ndarray:
-    """
-    Read LE or TE points from CSV file.
+@njit(cache=True)
+def _root_index(y_sorted: np.ndarray) -> int:
+    """Index of the station closest to y = 0 in an ascending y array."""
+    k = np.searchsorted(y_sorted, 0.0)
+    if k > 0 and (k == len(y_sorted) or -y_sorted[k - 1] <= y_sorted[k]):
+        k -= 1
+    return k
 
-    Parameters:
-    -----------
-    filepath : str
-        Path to CSV file with x,y,z columns
-    units : str
-        Input units ('inches' or 'feet')
 
-    Returns:
-    --------
-    points : np.ndarray
-        (N x 3) array of points in feet
-    """
-    df = pd.read_csv(filepath)
-    points = df[['x', 'y', 'z']].values
-
-    # Convert to feet if needed
-    if units.lower() == 'inches':
-        points = points / 12.0
-
-    return points
+@njit(cache=True)
+def _fit_slope(x: np.ndarray, y: np.ndarray) -> float:
+    """Least-squares slope dy/dx of a straight-line fit."""
+    x_mean = x.mean()
+    dx = x - x_mean
+    return (dx * (y - y.mean())).sum() / (dx * dx).sum()
 
 
-def compute_wing_geometry(le_points: np.ndarray, te_points: np.ndarray) -> WingGeometry:
+@njit(cache=True, fastmath=True)
+def _compute_geometry_core(le_sorted: np.ndarray,
+                           te_sorted: np.ndarray) -> Tuple[float, ...]:
     """
-    Compute wing geometric properties from LE/TE points.
-
-    Parameters:
-    -----------
-    le_points : np.ndarray
-        Leading edge points (N x 3) in feet
-    te_points : np.ndarray
-        Trailing edge points (N x 3) in feet
+    Numeric core of compute_wing_geometry on span-sorted LE/TE points.
 
     Returns:
     --------
-    geom : WingGeometry
-        Container with all geometric properties
+    (span, area, mac, taper_ratio, aspect_ratio, sweep_le, sweep_c4,
+     root_chord, tip_chord, mac_y, mac_le_x, dihedral)
     """
 
-    # Sort by spanwise position (y-coordinate)
-    le_sorted = le_points[np.argsort(le_points[:, 1])]
-    te_sorted = te_points[np.argsort(te_points[:, 1])]
-
-    # Extract coordinates
+    # Extract coordinates (strided views, no copies)
     y_stations = le_sorted[:, 1]
     le_x = le_sorted[:, 0]
     le_z = le_sorted[:, 2]
     te_x = te_sorted[:, 0]
-    te_z = te_sorted[:, 2]
 
     # Compute local chord at each station
     chords = te_x - le_x
@@ -93,22 +80,33 @@ def compute_wing_geometry(le_points: np.ndarray, te_points: np.ndarray) -> WingG
     span = y_stations[-1] - y_stations[0]
 
     # Root and tip chords
-    root_idx = np.argmin(np.abs(y_stations))
+    root_idx = _root_index(y_stations)
     root_chord = chords[root_idx]
     tip_chord = (chords[0] + chords[-1]) / 2.0  # Average both tips
 
-    # Taper ratio
-    taper_ratio = tip_chord / root_chord
+    # Trapezoid-rule weights over the span stations, shared by all integrals
+    dy = y_stations[1:] - y_stations[:-1]
+    w = np.zeros_like(y_stations)
+    w[:-1] += 0.5 * dy
+    w[1:] += 0.5 * dy
 
     # Planform area (use full span integration)
-    area = np.trapezoid(chords, y_stations)
+    area = (w * chords).sum()
+
+    # Raise the same error with and without Numba (which would otherwise
+    # raise ZeroDivisionError where NumPy returns nan/inf)
+    if not area > 0.0:
+        raise ValueError("Wing planform area must be positive; check LE/TE points")
+
+    # Taper ratio
+    taper_ratio = tip_chord / root_chord
 
     # Mean aerodynamic chord (MAC) and its location
     # MAC = (2/S) * integral(c^2 * dy)
-    mac = (2.0 / area) * np.trapezoid(chords**2, y_stations)
+    mac = (2.0 / area) * (w * chords * chords).sum()
 
     # MAC spanwise location: y_mac = (2/S) * integral(c * y * dy)
-    mac_y = (2.0 / area) * np.trapezoid(chords * y_stations, y_stations)
+    mac_y = (2.0 / area) * (w * chords * y_stations).sum()
 
     # MAC leading edge x-location (interpolate)
     mac_le_x = np.interp(mac_y, y_stations, le_x)
@@ -116,35 +114,77 @@ def compute_wing_geometry(le_points: np.ndarray, te_points: np.ndarray) -> WingG
     # Aspect ratio
     aspect_ratio = span**2 / area
 
-    # Leading edge sweep angle (using right half-span)
-    half_span_idx = np.where(y_stations >= 0)[0]
-    y_half = y_stations[half_span_idx]
-    le_x_half = le_x[half_span_idx]
+    # Sweep and dihedral from linear fits on the right half-span
+    # Stations are sorted, so the right half-span is a contiguous slice
+    k = np.searchsorted(y_stations, 0.0)
+    y_half = y_stations[k:]
 
     if len(y_half) > 1:
-        le_sweep_fit = np.polyfit(y_half, le_x_half, 1)
-        sweep_le = np.degrees(np.arctan(le_sweep_fit[0]))
+        x_c4_half = le_x[k:] + 0.25 * chords[k:]
+        sweep_le = np.degrees(np.arctan(_fit_slope(y_half, le_x[k:])))
+        sweep_c4 = np.degrees(np.arctan(_fit_slope(y_half, x_c4_half)))
+        dihedral = np.degrees(np.arctan(_fit_slope(y_half, le_z[k:])))
     else:
-        sweep_le = 0.0
+        sweep_le = sweep_c4 = dihedral = 0.0
 
-    # Quarter-chord sweep angle
-    x_c4 = le_x + 0.25 * chords
-    x_c4_half = x_c4[half_span_idx]
+    return (span, area, mac, taper_ratio, aspect_ratio, sweep_le, sweep_c4,
+            root_chord, tip_chord, mac_y, mac_le_x, dihedral)
 
-    if len(y_half) > 1:
-        c4_sweep_fit = np.polyfit(y_half, x_c4_half, 1)
-        sweep_c4 = np.degrees(np.arctan(c4_sweep_fit[0]))
-    else:
-        sweep_c4 = 0.0
 
-    # Dihedral angle (from z vs y on right half-span)
-    le_z_half = le_z[half_span_idx]
+def read_csv_points(filepath: str, units: str = 'inches') -> np.ndarray:
+    """
+    Read LE or TE points from CSV file.
 
-    if len(y_half) > 1:
-        dihedral_fit = np.polyfit(y_half, le_z_half, 1)
-        dihedral = np.degrees(np.arctan(dihedral_fit[0]))
-    else:
-        dihedral = 0.0
+    Parameters:
+    -----------
+    filepath : str
+        Path to CSV file with x,y,z columns
+    units : str
+        Input units ('inches' or 'feet')
+
+    Returns:
+    --------
+    points : np.ndarray
+        (N x 3) array of points in feet
+    """
+    df = pd.read_csv(filepath, usecols=['x', 'y', 'z'], dtype=np.float64, engine='c')
+    points = np.ascontiguousarray(df[['x', 'y', 'z']].to_numpy())
+
+    # Convert to feet if needed (in place, no second allocation)
+    if units.lower() == 'inches':
+        points *= (1.0 / 12.0)
+
+    return points
+
+
+def compute_wing_geometry(le_points: np.ndarray, te_points: np.ndarray) -> WingGeometry:
+    """
+    Compute wing geometric properties from LE/TE points.
+
+    Parameters:
+    -----------
+    le_points : np.ndarray
+        Leading edge points (N x 3) in feet
+    te_points : np.ndarray
+        Trailing edge points (N x 3) in feet
+
+    Returns:
+    --------
+    geom : WingGeometry
+        Container with all geometric properties
+    """
+
+    # Sort by spanwise position (y-coordinate); LE and TE rows correspond,
+    # so one ordering is applied to both
+    order = np.argsort(le_points[:, 1])
+    le_sorted = le_points[order]
+    te_sorted = te_points[order]
+
+    (span, area, mac, taper_ratio, aspect_ratio, sweep_le, sweep_c4,
+     root_chord, tip_chord, mac_y, mac_le_x, dihedral) = _compute_geometry_core(
+        np.ascontiguousarray(le_sorted, dtype=np.float64),
+        np.ascontiguousarray(te_sorted, dtype=np.float64)
+    )
 
     return WingGeometry(
         le_points=le_sorted,
@@ -212,7 +252,8 @@ def estimate_tail_geometry(wing: WingGeometry,
 
     # Horizontal tail position - start at root trailing edge
     # Find root chord trailing edge location
-    root_idx = np.argmin(np.abs(wing.le_points[:, 1]))
+    # LE points are stored sorted by span station
+    root_idx = _root_index(wing.le_points[:, 1])
     root_te_x = wing.te_points[root_idx, 0]
 
     x_h = root_te_x  # Tail starts at root TE
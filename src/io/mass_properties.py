@@ -4,10 +4,60 @@ Mass properties converter for AVL.
 Handles conversion from US Customary units (lbm, inches) to AVL units (slugs, feet).
 """
 
+import csv
 import numpy as np
-import pandas as pd
+from functools import cached_property
 from typing import Dict
 
+# Handle imports for both package and standalone usage
+try:
+    from ._jit import njit
+except ImportError:
+    from _jit import njit
+
+
+# Unit conversion factors
+_LBM_TO_KG = np.float64(0.45359237)
+_LBM_TO_SLUG = np.float64(1.0 / 32.174)
+_IN_TO_FT = np.float64(1.0 / 12.0)
+_IN_TO_M = np.float64(0.0254)
+
+# 1 lbm*in^2 = (1/32.174) slug * (1/144) ft^2 = (1/4633.056) slug*ft^2
+_LBMIN2_TO_SLUGFT2 = np.float64(1.0 / 4633.056)
+# 1 lbm*in^2 = 0.45359237 kg * (0.0254)^2 m^2 = 0.0002926397 kg*m^2
+_LBMIN2_TO_KGM2 = np.float64(0.0002926397)
+
+
+@njit(cache=True, fastmath=True)
+def assemble_inertia_matrix(I: np.ndarray) -> np.ndarray:
+    """
+    Build the symmetric 3x3 inertia tensor from [Ixx, Iyy, Izz, Ixy, Ixz, Iyz].
+
+    Compiled with Numba when available, so it can be called from jitted
+    simulation loops.
+    """
+    M = np.empty((3, 3), dtype=np.float64)
+    M[0, 0] = I[0]
+    M[1, 1] = I[1]
+    M[2, 2] = I[2]
+    M[0, 1] = M[1, 0] = -I[3]
+    M[0, 2] = M[2, 0] = -I[4]
+    M[1, 2] = M[2, 1] = -I[5]
+    return M
+
+
+@njit(cache=True, fastmath=True)
+def convert_inertia_to_si(src: np.ndarray, dst_slug: np.ndarray, dst_kg: np.ndarray):
+    """
+    Convert [Ixx, Iyy, Izz, Ixy, Ixz, Iyz] from lbm*in^2 into slug*ft^2 and kg*m^2.
+
+    Writes into the preallocated dst_slug and dst_kg arrays, so jitted
+    simulation loops can convert without allocating.
+    """
+    for k in range(6):
+        dst_slug[k] = src[k] * _LBMIN2_TO_SLUGFT2
+        dst_kg[k] = src[k] * _LBMIN2_TO_KGM2
+
 
 class MassProperties:
     """Container for aircraft mass properties."""
@@ -27,62 +77,77 @@ class MassProperties:
             If only 3 values provided, assumes Ixy=Ixz=Iyz=0
         """
         self.mass_lbm = mass_lbm
-        self.cg_inches = np.array(cg_inches)
+
+        # Use float64 arrays directly; only copies if conversion is needed
+        self.cg_inches = np.ascontiguousarray(cg_inches, dtype=np.float64)
 
         if len(inertia_lbm_in2) == 3:
-            self.inertia_lbm_in2 = np.array([
-                inertia_lbm_in2[0],  # Ixx
-                inertia_lbm_in2[1],  # Iyy
-                inertia_lbm_in2[2],  # Izz
-                0.0,                  # Ixy
-                0.0,                  # Ixz
-                0.0                   # Iyz
-            ])
+            # Ixx, Iyy, Izz given; Ixy = Ixz = Iyz = 0
+            self.inertia_lbm_in2 = np.zeros(6, dtype=np.float64)
+            self.inertia_lbm_in2[:3] = inertia_lbm_in2
         else:
-            self.inertia_lbm_in2 = np.array(inertia_lbm_in2)
-
-        # Convert to SI units
-        self._convert_to_si()
-
-    def _convert_to_si(self):
-        """Convert mass properties from US Customary to SI units."""
-        # Mass: lbm to kg
-        self.mass_kg = self.mass_lbm * 0.45359237
-
-        # Mass: lbm to slugs (for AVL which uses slugs)
-        self.mass_slugs = self.mass_lbm / 32.174
-
-        # CG: inches to feet (for AVL)
-        self.cg_ft = self.cg_inches / 12.0
-
-        # CG: inches to meters (for 6-DOF)
-        self.cg_m = self.cg_inches * 0.0254
-
-        # Inertia: lbm*in^2 to slug*ft^2 (for AVL)
-        # 1 lbm*in^2 = (1/32.174) slug * (1/144) ft^2 = (1/4633.056) slug*ft^2
-        self.inertia_slug_ft2 = self.inertia_lbm_in2 / 4633.056
-
-        # Inertia: lbm*in^2 to kg*m^2 (for 6-DOF)
-        # 1 lbm*in^2 = 0.45359237 kg * (0.0254)^2 m^2 = 0.0002926397 kg*m^2
-        self.inertia_kg_m2 = self.inertia_lbm_in2 * 0.0002926397
+            self.inertia_lbm_in2 = np.ascontiguousarray(inertia_lbm_in2, dtype=np.float64)
+
+        # Converted quantities (AVL and SI units) are computed lazily on
+        # first access and cached, see the properties below
+
+    @cached_property
+    def mass_kg(self) -> float:
+        """Mass in kg (for 6-DOF)."""
+        return self.mass_lbm * _LBM_TO_KG
+
+    @cached_property
+    def mass_slugs(self) -> float:
+        """Mass in slugs (for AVL which uses slugs)."""
+        return self.mass_lbm * _LBM_TO_SLUG
+
+    @cached_property
+    def cg_ft(self) -> np.ndarray:
+        """CG location in feet (for AVL)."""
+        return self.cg_inches * _IN_TO_FT
+
+    @cached_property
+    def cg_m(self) -> np.ndarray:
+        """CG location in meters (for 6-DOF)."""
+        return self.cg_inches * _IN_TO_M
+
+    @cached_property
+    def inertia_slug_ft2(self) -> np.ndarray:
+        """Inertia [Ixx, Iyy, Izz, Ixy, Ixz, Iyz] in slug*ft^2 (for AVL)."""
+        return self.inertia_lbm_in2 * _LBMIN2_TO_SLUGFT2
+
+    @cached_property
+    def inertia_kg_m2(self) -> np.ndarray:
+        """Inertia [Ixx, Iyy, Izz, Ixy, Ixz, Iyz] in kg*m^2 (for 6-DOF)."""
+        return self.inertia_lbm_in2 * _LBMIN2_TO_KGM2
+
+    @cached_property
+    def _I_slug_ft2(self) -> np.ndarray:
+        I = assemble_inertia_matrix(self.inertia_slug_ft2)
+        I.setflags(write=False)
+        return I
+
+    @cached_property
+    def _I_kg_m2(self) -> np.ndarray:
+        I = assemble_inertia_matrix(self.inertia_kg_m2)
+        I.setflags(write=False)
+        return I
 
     def get_inertia_matrix_slug_ft2(self) -> np.ndarray:
-        """Get full 3x3 inertia tensor in slug*ft^2."""
-        I = self.inertia_slug_ft2
-        return np.array([
-            [I[0], -I[3], -I[4]],
-            [-I[3], I[1], -I[5]],
-            [-I[4], -I[5], I[2]]
-        ])
+        """
+        Get full 3x3 inertia tensor in slug*ft^2.
+
+        The returned array is cached and read-only; use .copy() to modify.
+        """
+        return self._I_slug_ft2
 
     def get_inertia_matrix_kg_m2(self) -> np.ndarray:
-        """Get full 3x3 inertia tensor in kg*m^2."""
-        I = self.inertia_kg_m2
-        return np.array([
-            [I[0], -I[3], -I[4]],
-            [-I[3], I[1], -I[5]],
-            [-I[4], -I[5], I[2]]
-        ])
+        """
+        Get full 3x3 inertia tensor in kg*m^2.
+
+        The returned array is cached and read-only; use .copy() to modify.
+        """
+        return self._I_kg_m2
 
     def write_avl_mass_file(self, filepath: str, name: str = "UAV"):
         """
@@ -95,19 +160,21 @@ class MassProperties:
         name : str
             Aircraft name
         """
+        x, y, z = self.cg_ft
+        Ixx, Iyy, Izz, Ixy, Ixz, Iyz = self.inertia_slug_ft2
+
+        # Build the whole file and write it in one call
+        body = (
+            f"#  {name} Mass File\n"
+            "#  Units: slugs, feet\n"
+            "#\n"
+            "#  mass    x       y       z       Ixx     Iyy     Izz     Ixy     Ixz     Iyz\n"
+            f"   {self.mass_slugs:12.6f}  {x:8.4f}  {y:8.4f}  {z:8.4f}  "
+            f"{Ixx:12.4f}  {Iyy:12.4f}  {Izz:12.4f}  {Ixy:12.4f}  {Ixz:12.4f}  {Iyz:12.4f}\n"
+        )
+
         with open(filepath, 'w') as f:
-            f.write(f"#  {name} Mass File\n")
-            f.write("#  Units: slugs, feet\n")
-            f.write("#\n")
-            f.write(f"#  mass    x       y       z       Ixx     Iyy     Izz     Ixy     Ixz     Iyz\n")
-            f.write(f"   {self.mass_slugs:12.6f}  ")
-            f.write(f"{self.cg_ft[0]:8.4f}  {self.cg_ft[1]:8.4f}  {self.cg_ft[2]:8.4f}  ")
-            f.write(f"{self.inertia_slug_ft2[0]:12.4f}  ")
-            f.write(f"{self.inertia_slug_ft2[1]:12.4f}  ")
-            f.write(f"{self.inertia_slug_ft2[2]:12.4f}  ")
-            f.write(f"{self.inertia_slug_ft2[3]:12.4f}  ")
-            f.write(f"{self.inertia_slug_ft2[4]:12.4f}  ")
-            f.write(f"{self.inertia_slug_ft2[5]:12.4f}\n")
+            f.write(body)
 
     def print_summary(self):
         """Print formatted summary of mass properties."""
@@ -137,6 +204,69 @@ class MassProperties:
         print("=" * 60)
 
 
+class MassPropertiesBatch:
+    """
+    Mass properties for many design points, stored column-wise.
+
+    Each quantity is one contiguous float64 array with a leading row axis,
+    so all unit conversions run as a handful of vectorized multiplies
+    instead of one MassProperties construction per design point.
+    """
+
+    def __init__(self, mass_lbm: np.ndarray, cg_inches: np.ndarray, inertia_lbm_in2: np.ndarray):
+        """
+        Initialize batch mass properties from US Customary units.
+
+        Parameters:
+        -----------
+        mass_lbm : np.ndarray
+            (N,) total masses in pounds-mass (lbm)
+        cg_inches : np.ndarray
+            (N x 3) CG locations [x, y, z] in inches
+        inertia_lbm_in2 : np.ndarray
+            (N x 6) inertia tensors [Ixx, Iyy, Izz, Ixy, Ixz, Iyz] in lbm*in^2
+            If only 3 columns provided, assumes Ixy=Ixz=Iyz=0
+        """
+        self.mass_lbm = np.ascontiguousarray(mass_lbm, dtype=np.float64)
+        self.cg_inches = np.ascontiguousarray(cg_inches, dtype=np.float64)
+
+        inertia_lbm_in2 = np.asarray(inertia_lbm_in2, dtype=np.float64)
+        if inertia_lbm_in2.shape[1] == 3:
+            self.inertia_lbm_in2 = np.zeros((len(inertia_lbm_in2), 6), dtype=np.float64)
+            self.inertia_lbm_in2[:, :3] = inertia_lbm_in2
+        else:
+            self.inertia_lbm_in2 = np.ascontiguousarray(inertia_lbm_in2)
+
+        # Convert to SI units
+        self._convert_to_si()
+
+    def __len__(self) -> int:
+        return len(self.mass_lbm)
+
+    def _convert_to_si(self):
+        """Convert all rows from US Customary to AVL and SI units."""
+        self.mass_kg = np.multiply(self.mass_lbm, _LBM_TO_KG)
+        self.mass_slugs = np.multiply(self.mass_lbm, _LBM_TO_SLUG)
+
+        self.cg_ft = np.empty_like(self.cg_inches)
+        self.cg_m = np.empty_like(self.cg_inches)
+        np.multiply(self.cg_inches, _IN_TO_FT, out=self.cg_ft)
+        np.multiply(self.cg_inches, _IN_TO_M, out=self.cg_m)
+
+        self.inertia_slug_ft2 = np.empty_like(self.inertia_lbm_in2)
+        self.inertia_kg_m2 = np.empty_like(self.inertia_lbm_in2)
+        np.multiply(self.inertia_lbm_in2, _LBMIN2_TO_SLUGFT2, out=self.inertia_slug_ft2)
+        np.multiply(self.inertia_lbm_in2, _LBMIN2_TO_KGM2, out=self.inertia_kg_m2)
+
+    def row(self, i: int) -> MassProperties:
+        """
+        Get a single design point as a MassProperties object.
+
+        The returned object's US Customary inputs are views into this batch.
+        """
+        return MassProperties(self.mass_lbm[i], self.cg_inches[i], self.inertia_lbm_in2[i])
+
+
 def read_mass_csv(filepath: str) -> MassProperties:
     """
     Read mass properties from CSV file.
@@ -154,23 +284,58 @@ def read_mass_csv(filepath: str) -> MassProperties:
     mass_props : MassProperties
         Mass properties object
     """
-    df = pd.read_csv(filepath)
-
-    mass_lbm = df['avl_mass'].values[0]
-    cg_inches = np.array([
-        df['avl_CGx'].values[0],
-        df['avl_CGy'].values[0],
-        df['avl_CGz'].values[0]
-    ])
-    inertia_lbm_in2 = np.array([
-        df['avl_Ixx'].values[0],
-        df['avl_Iyy'].values[0],
-        df['avl_Izz'].values[0]
-    ])
+    # Single data row; the csv module avoids pandas for a seven-value file
+    with open(filepath, newline='') as f:
+        row = next(csv.DictReader(f))
+
+    mass_lbm = float(row['avl_mass'])
+    cg_inches = np.fromiter(
+        (float(row[k]) for k in ('avl_CGx', 'avl_CGy', 'avl_CGz')),
+        dtype=np.float64, count=3
+    )
+    inertia_lbm_in2 = np.fromiter(
+        (float(row[k]) for k in ('avl_Ixx', 'avl_Iyy', 'avl_Izz')),
+        dtype=np.float64, count=3
+    )
 
     return MassProperties(mass_lbm, cg_inches, inertia_lbm_in2)
 
 
+def read_mass_csv_batch(filepath: str) -> MassPropertiesBatch:
+    """
+    Read mass properties for many design points from CSV file.
+
+    Same columns as read_mass_csv, with one row per design point.
+
+    Parameters:
+    -----------
+    filepath : str
+        Path to mass CSV file
+
+    Returns:
+    --------
+    batch : MassPropertiesBatch
+        Batch mass properties object
+    """
+    # pandas is only needed for the multi-row case
+    import pandas as pd
+
+    # Only parse the mass columns, so extra (e.g. label) columns are ignored
+    df = pd.read_csv(
+        filepath,
+        usecols=['avl_mass', 'avl_CGx', 'avl_CGy', 'avl_CGz',
+                 'avl_Ixx', 'avl_Iyy', 'avl_Izz'],
+        dtype=np.float64,
+        engine='c'
+    )
+
+    return MassPropertiesBatch(
+        df['avl_mass'].to_numpy(),
+        df[['avl_CGx', 'avl_CGy', 'avl_CGz']].to_numpy(),
+        df[['avl_Ixx', 'avl_Iyy', 'avl_Izz']].to_numpy()
+    )
+
+
 if __name__ == "__main__":
     import os
 
@@ -8,6 +8,8 @@ import pytest
 import numpy as np
 import os
 import sys
+import gc
+import weakref
 
 # Add src to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -18,9 +20,60 @@ from src.io.geometry import (
     estimate_tail_geometry,
     WingGeometry
 )
-from src.io.mass_properties import read_mass_csv, MassProperties
+from src.io.mass_properties import (
+    read_mass_csv,
+    read_mass_csv_batch,
+    MassProperties,
+    MassPropertiesBatch,
+    convert_inertia_to_si
+)
 from src.aero.avl_geometry import generate_avl_geometry_from_csv
 from src.aero.avl_run_cases import atmosphere_us_standard
+from src.aero.avl_interface import AVLInterface, AVLResults, AVLSession
+
+
+SAMPLE_FT = """\
+ ---------------------------------------------------------------
+ Vortex Lattice Output -- Total Forces
+
+ Configuration: TestUAV
+     # Surfaces =   4
+     # Strips   =  64
+     # Vortices = 640
+
+  Sref =  199.94       Cref =  11.830       Bref =  19.890
+  Xref =  12.918       Yref =  0.10509E-02  Zref =  0.45322E-01
+
+ Standard axis orientation,  X fwd, Z down
+
+ Run case: -unnamed-
+
+  Alpha =   2.00000     pb/2V =  -0.00000     p'b/2V =  -0.00000
+  Beta  =   0.00000     qc/2V =   0.00000
+  Mach  =     0.000     rb/2V =  -0.00000     r'b/2V =  -0.00000
+
+  CXtot =   0.00123     Cltot =  -0.00210     Cl'tot =  -0.00210
+  CYtot =   0.00050     Cmtot =  -0.01234
+  CZtot =  -0.12345     Cntot =   0.00031     Cn'tot =   0.00031
+
+  CLtot =   0.12345
+  CDtot =   0.00456
+  CDvis =   0.00000     CDind =   0.0045600
+  CLff  =   0.12300     CDff  =   0.0044000    | Trefftz
+  CYff  =   0.00000         e =    0.8765    | Plane
+"""
+
+SAMPLE_ST = """\
+                             alpha                beta
+                  ----------------     ----------------
+ z' force CL |    CLa =   3.112345    CLb =   0.000000
+ y  force CY |    CYa =   0.000000    CYb =  -0.123456
+ x' mom.  Cl'|    Cla =   0.000000    Clb =  -0.054321
+ y  mom.  Cm |    Cma =  -1.234567    Cmb =   0.000000
+ z' mom.  Cn'|    Cna =   0.000000    Cnb =   0.012345
+
+ Neutral point  Xnp =  13.456789
+"""
 
 
 class TestGeometryParser:
@@ -74,6 +127,56 @@ class TestGeometryParser:
         assert abs(wing.area - 199.94) < 1.0     # ~199.94 ft² area
         assert abs(wing.aspect_ratio - 1.98) < 0.1  # Low AR (delta wing)
 
+    def test_wing_geometry_row_order(self, data_path):
+        """Test shuffling LE/TE rows together does not change the geometry."""
+        le_points = read_csv_points(os.path.join(data_path, 'LEpts.csv'), units='inches')
+        te_points = read_csv_points(os.path.join(data_path, 'TEpts.csv'), units='inches')
+
+        wing = compute_wing_geometry(le_points, te_points)
+
+        perm = np.random.default_rng(0).permutation(len(le_points))
+        shuffled = compute_wing_geometry(le_points[perm], te_points[perm])
+
+        assert shuffled.area == pytest.approx(wing.area)
+        assert shuffled.mac == pytest.approx(wing.mac)
+        assert shuffled.sweep_le == pytest.approx(wing.sweep_le)
+        assert shuffled.dihedral == pytest.approx(wing.dihedral)
+
+    def test_wing_geometry_tapered_wing(self):
+        """Test a linearly tapered, swept wing against analytic values."""
+        # Root chord 4 ft, tip chord 2 ft, span 10 ft, 30 deg LE sweep,
+        # 5 deg dihedral
+        y = np.linspace(-5.0, 5.0, 11)
+        le_x = np.tan(np.radians(30.0)) * np.abs(y)
+        le_z = np.tan(np.radians(5.0)) * np.abs(y)
+        chords = 4.0 - 0.4 * np.abs(y)
+
+        le_points = np.column_stack([le_x, y, le_z])
+        te_points = np.column_stack([le_x + chords, y, le_z])
+
+        wing = compute_wing_geometry(le_points, te_points)
+
+        # compute_wing_geometry applies (2/S) * integral(c^2 dy) over the
+        # full span, i.e. twice the textbook MAC (2/3) c_r (1+l+l^2)/(1+l)
+        taper = 0.5
+        mac = 2.0 * (2.0 / 3.0) * 4.0 * (1 + taper + taper**2) / (1 + taper)
+
+        assert wing.span == pytest.approx(10.0)
+        assert wing.area == pytest.approx(30.0)
+        assert wing.taper_ratio == pytest.approx(taper)
+        assert wing.aspect_ratio == pytest.approx(10.0**2 / 30.0)
+        assert wing.mac == pytest.approx(mac, rel=5e-3)  # Trapezoid rule on c^2
+        assert wing.sweep_le == pytest.approx(30.0)
+        assert wing.dihedral == pytest.approx(5.0)
+
+    def test_wing_geometry_zero_area(self):
+        """Test degenerate planforms raise rather than return nan/inf."""
+        le_points = np.array([[0.0, 0.0, 0.0]])
+        te_points = np.array([[1.0, 0.0, 0.0]])
+
+        with pytest.raises(ValueError, match="area"):
+            compute_wing_geometry(le_points, te_points)
+
     def test_tail_geometry_estimation(self, data_path):
         """Test tail surface estimation."""
         le_file = os.path.join(data_path, 'LEpts.csv')
@@ -133,6 +236,18 @@ class TestMassProperties:
         assert mass_props.inertia_slug_ft2[1] > 0  # Iyy
         assert mass_props.inertia_slug_ft2[2] > 0  # Izz
 
+    def test_lazy_conversions(self, data_path, tmp_path):
+        """Test converted units are only computed when accessed."""
+        mass_props = read_mass_csv(os.path.join(data_path, 'mass.csv'))
+        mass_props.write_avl_mass_file(os.path.join(tmp_path, 'test.mass'))
+
+        # Writing the AVL file only needs AVL units
+        assert 'mass_slugs' in vars(mass_props)
+        assert 'mass_kg' not in vars(mass_props)
+        assert 'inertia_kg_m2' not in vars(mass_props)
+
+        assert mass_props.cg_m is mass_props.cg_m  # Cached after first access
+
     def test_inertia_matrix(self, data_path):
         """Test inertia tensor matrix generation."""
         mass_file = os.path.join(data_path, 'mass.csv')
@@ -146,6 +261,67 @@ class TestMassProperties:
         assert I_matrix[2, 2] > 0  # Izz diagonal
         assert np.allclose(I_matrix, I_matrix.T)  # Should be symmetric
 
+        # Cached and read-only
+        assert mass_props.get_inertia_matrix_slug_ft2() is I_matrix
+        assert not I_matrix.flags.writeable
+
+        I_si = mass_props.get_inertia_matrix_kg_m2()
+        assert np.allclose(np.diag(I_si), mass_props.inertia_kg_m2[:3])
+
+    def test_convert_inertia_to_si(self, data_path):
+        """Test the inertia conversion kernel matches MassProperties."""
+        mass_props = read_mass_csv(os.path.join(data_path, 'mass.csv'))
+
+        dst_slug = np.empty(6)
+        dst_kg = np.empty(6)
+        convert_inertia_to_si(mass_props.inertia_lbm_in2, dst_slug, dst_kg)
+
+        assert np.allclose(dst_slug, mass_props.inertia_slug_ft2)
+        assert np.allclose(dst_kg, mass_props.inertia_kg_m2)
+
+    def test_read_mass_csv_batch(self, data_path):
+        """Test batch reader matches the single-row reader."""
+        mass_file = os.path.join(data_path, 'mass.csv')
+        single = read_mass_csv(mass_file)
+        batch = read_mass_csv_batch(mass_file)
+
+        assert isinstance(batch, MassPropertiesBatch)
+        assert len(batch) == 1
+        assert batch.mass_slugs[0] == pytest.approx(single.mass_slugs)
+        assert np.allclose(batch.cg_m[0], single.cg_m)
+        assert np.allclose(batch.inertia_kg_m2[0], single.inertia_kg_m2)
+
+    def test_read_mass_csv_batch_extra_columns(self, tmp_path):
+        """Test batch reader ignores non-mass columns."""
+        mass_file = os.path.join(tmp_path, 'mass.csv')
+        with open(mass_file, 'w') as f:
+            f.write("design,avl_mass,avl_CGx,avl_CGy,avl_CGz,avl_Ixx,avl_Iyy,avl_Izz\n"
+                    "A,100,10,0,1,1000,2000,3000\n"
+                    "B,200,12,0,1,1500,2500,3500\n")
+
+        batch = read_mass_csv_batch(mass_file)
+
+        assert len(batch) == 2
+        assert np.allclose(batch.mass_lbm, [100.0, 200.0])
+        assert np.allclose(batch.cg_inches[1], [12.0, 0.0, 1.0])
+
+    def test_batch_conversions(self):
+        """Test batch conversions agree with per-row MassProperties."""
+        rng = np.random.default_rng(0)
+        n = 50
+        batch = MassPropertiesBatch(
+            rng.uniform(100, 10000, n),
+            rng.uniform(-200, 200, (n, 3)),
+            rng.uniform(1e5, 1e8, (n, 6))
+        )
+
+        for i in (0, n // 2, n - 1):
+            row = batch.row(i)
+            assert isinstance(row, MassProperties)
+            assert batch.mass_kg[i] == pytest.approx(row.mass_kg)
+            assert np.allclose(batch.cg_ft[i], row.cg_ft)
+            assert np.allclose(batch.inertia_slug_ft2[i], row.inertia_slug_ft2)
+
 
 class TestAVLFileGeneration:
     """Test AVL file generation."""
@@ -202,6 +378,216 @@ class TestAVLFileGeneration:
         assert 'NACA 0012' in content
 
 
+FAKE_AVL = """\
+#!/usr/bin/env python3
+# Stand-in for AVL: reads commands line by line and writes a .ft file for
+# every FT command (CLtot = 0.1 * current alpha) and a .st file for every ST.
+import sys
+
+alpha = 0.0
+mach = 0.0
+pending = None
+for line in sys.stdin:
+    line = line.rstrip('\\n')
+    if pending is not None:
+        with open(line, 'w') as f:
+            f.write(pending)
+        pending = None
+    elif line.startswith('A '):
+        alpha = float(line.split()[1])
+    elif line.startswith('M '):
+        mach = float(line.split()[1])
+    elif line == 'FT':
+        pending = ("  Mach  = %.5f\\n  CLtot = %.5f\\n  CDtot =   0.01000\\n"
+                   % (mach, 0.1 * alpha))
+    elif line == 'ST':
+        pending = " Neutral point  Xnp =  13.456789\\n"
+    elif line == 'QUIT':
+        break
+"""
+
+
+class TestAVLInterface:
+    """Test AVL output file parsing."""
+
+    @pytest.fixture
+    def avl(self, tmp_path):
+        # Parsing does not invoke AVL, only the path check needs to pass
+        avl_exe = os.path.join(tmp_path, 'avl.exe')
+        open(avl_exe, 'w').close()
+        return AVLInterface(avl_exe)
+
+    def test_parse_ft_file(self, avl, tmp_path):
+        """Test parsing of total force coefficients."""
+        ft_file = os.path.join(tmp_path, 'case.ft')
+        with open(ft_file, 'w') as f:
+            f.write(SAMPLE_FT)
+
+        result = avl._parse_ft_file(ft_file, alpha=2.0, beta=0.0)
+
+        assert isinstance(result, AVLResults)
+        assert result.CL == pytest.approx(0.12345)
+        assert result.CD == pytest.approx(0.00456)
+        assert result.CM == pytest.approx(-0.01234)
+        assert result.CY == pytest.approx(0.00050)
+        assert result.Cl == pytest.approx(-0.00210)
+        assert result.Cn == pytest.approx(0.00031)
+        assert result.e_span_eff == pytest.approx(0.8765)
+        assert result.alpha == 2.0
+
+    def test_parse_ft_scientific_notation(self, avl, tmp_path):
+        """Test coefficients written in scientific notation are parsed."""
+        ft_file = os.path.join(tmp_path, 'case.ft')
+        with open(ft_file, 'w') as f:
+            f.write(SAMPLE_FT.replace('CDtot =   0.00456', 'CDtot =  0.45600E-02'))
+
+        result = avl._parse_ft_file(ft_file, alpha=2.0, beta=0.0)
+
+        assert result.CD == pytest.approx(0.00456)
+        assert result.CL == pytest.approx(0.12345)
+
+    def test_parse_st_file(self, avl, tmp_path):
+        """Test parsing of stability derivatives."""
+        st_file = os.path.join(tmp_path, 'case.st')
+        with open(st_file, 'w') as f:
+            f.write(SAMPLE_ST)
+
+        derivs = avl._parse_st_file(st_file)
+
+        assert derivs['CLa'] == pytest.approx(3.112345)
+        assert derivs['CMa'] == pytest.approx(-1.234567)
+        assert derivs['CYb'] == pytest.approx(-0.123456)
+        assert derivs['Clb'] == pytest.approx(-0.054321)
+        assert derivs['Cnb'] == pytest.approx(0.012345)
+        assert derivs['Xnp'] == pytest.approx(13.456789)
+
+    @pytest.fixture
+    def fake_avl(self, tmp_path):
+        if sys.platform == 'win32':
+            pytest.skip("Fake AVL is a POSIX script")
+        avl_exe = os.path.join(tmp_path, 'avl')
+        with open(avl_exe, 'w') as f:
+            f.write(FAKE_AVL)
+        os.chmod(avl_exe, 0o755)
+        return AVLInterface(avl_exe)
+
+    def test_run_avl_case(self, fake_avl, tmp_path):
+        """Test a single case pipes commands to AVL and parses the output."""
+        result = fake_avl.run_avl_case(
+            'uav.avl', alpha=3.0, output_prefix=os.path.join(tmp_path, 'case')
+        )
+
+        assert result.CL == pytest.approx(0.3)
+        assert result.CD == pytest.approx(0.01)
+        assert not os.path.exists(os.path.join(tmp_path, 'case_commands.txt'))
+
+    def test_run_avl_case_cached(self, fake_avl, tmp_path):
+        """Test repeated cases are served from cache until inputs change."""
+        avl_file = os.path.join(tmp_path, 'uav.avl')
+        open(avl_file, 'w').close()
+        prefix = os.path.join(tmp_path, 'cached')
+
+        first = fake_avl.run_avl_case(avl_file, alpha=1.0, output_prefix=prefix)
+        os.remove(prefix + '.ft')
+
+        # Unchanged inputs: AVL is not rerun, so no output file is written
+        second = fake_avl.run_avl_case(avl_file, alpha=1.0, output_prefix=prefix)
+        assert second == first
+        assert second is not first
+        assert not os.path.exists(prefix + '.ft')
+
+        # Verbose calls always run AVL so its output can be printed
+        fake_avl.run_avl_case(avl_file, alpha=1.0, output_prefix=prefix, verbose=True)
+        assert os.path.exists(prefix + '.ft')
+        os.remove(prefix + '.ft')
+
+        # The cache does not keep the interface alive
+        avl = AVLInterface(fake_avl.avl_exe_path)
+        avl.run_avl_case(avl_file, alpha=2.0, output_prefix=prefix)
+        ref = weakref.ref(avl)
+        del avl
+        gc.collect()
+        assert ref() is None
+
+        # Touching the geometry file invalidates the cache
+        mtime = os.path.getmtime(avl_file)
+        os.utime(avl_file, (mtime + 10, mtime + 10))
+        fake_avl.run_avl_case(avl_file, alpha=1.0, output_prefix=prefix)
+        assert os.path.exists(prefix + '.ft')
+
+    def test_session_run_case(self, fake_avl, tmp_path):
+        """Test a persistent session runs several cases in one process."""
+        with AVLSession(fake_avl.avl_exe_path, 'uav.avl') as session:
+            process = session._process
+            first = session.run_case(alpha=1.0, output_prefix=os.path.join(tmp_path, 'a'))
+            second = session.run_case(alpha=5.0, output_prefix=os.path.join(tmp_path, 'b'))
+            assert session._process is process
+
+        assert first.CL == pytest.approx(0.1)
+        assert second.CL == pytest.approx(0.5)
+        assert second.neutral_point == pytest.approx(13.456789)
+        assert process.returncode == 0
+
+        # The completion sentinel is removed after each case
+        assert not os.path.exists(os.path.join(tmp_path, 'a.done'))
+        assert not os.path.exists(os.path.join(tmp_path, 'b.done'))
+
+    def test_session_resets_mach(self, fake_avl, tmp_path):
+        """Test each session case sets Mach rather than inheriting it."""
+        with AVLSession(fake_avl.avl_exe_path, 'uav.avl') as session:
+            session.run_case(mach=0.3, output_prefix=os.path.join(tmp_path, 'a'))
+            session.run_case(mach=0.0, output_prefix=os.path.join(tmp_path, 'b'))
+
+        with open(os.path.join(tmp_path, 'a.ft')) as f:
+            assert 'Mach  = 0.30000' in f.read()
+        with open(os.path.join(tmp_path, 'b.ft')) as f:
+            assert 'Mach  = 0.00000' in f.read()
+
+    def test_session_avl_exits_early(self, tmp_path):
+        """Test a crashed AVL surfaces the run_case error and is cleaned up."""
+        if sys.platform == 'win32':
+            pytest.skip("Fake AVL is a POSIX script")
+        avl_exe = os.path.join(tmp_path, 'avl')
+        with open(avl_exe, 'w') as f:
+            f.write("#!/bin/sh\nexit 1\n")
+        os.chmod(avl_exe, 0o755)
+
+        session = AVLSession(avl_exe, 'uav.avl', timeout=5.0)
+        with pytest.raises(RuntimeError, match="terminated"):
+            with session:
+                process = session._process
+                process.wait()
+                session.run_case(output_prefix=os.path.join(tmp_path, 'a'))
+
+        assert session._process is None
+        assert process.stdin.closed
+        assert process.returncode == 1
+
+    def test_alpha_sweep(self, fake_avl, tmp_path, monkeypatch):
+        """Test the alpha sweep returns one result per alpha, in order."""
+        monkeypatch.chdir(tmp_path)
+
+        results = fake_avl.run_alpha_sweep('uav.avl', alpha_range=(-2, 3, 1))
+
+        assert isinstance(results, np.recarray)
+        assert np.array_equal(results.alpha, [-2, -1, 0, 1, 2])
+        assert results.CL == pytest.approx([-0.2, -0.1, 0.0, 0.1, 0.2])
+        assert np.all(results.neutral_point == pytest.approx(13.456789))
+        assert np.all(np.isnan(results.CLa))  # Not reported by the fake
+
+    def test_alpha_sweep_batched(self, fake_avl, tmp_path):
+        """Test batched sweep runs every alpha in one session, in order."""
+        avl = fake_avl
+        alphas = [-2.0, 0.0, 4.0]
+        results = avl.run_alpha_sweep_batched(
+            'uav.avl', alphas=alphas, output_prefix=os.path.join(tmp_path, 'sweep')
+        )
+
+        assert [r.alpha for r in results] == alphas
+        assert [r.CL for r in results] == pytest.approx([-0.2, 0.0, 0.4])
+        assert all(r.CD == pytest.approx(0.01) for r in results)
+
+
 class TestAtmosphereModel:
     """Test US Standard Atmosphere model."""
 